@@ -3,66 +3,46 @@ Build script to create Windows executable.
 Run this script to generate the .exe file.
 """
 
+import argparse
+import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
-def install_requirements():
-    """Install required packages."""
-    print("Installing required packages...")
-    packages = [
-        "gitingest",
-        "pyinstaller"
-    ]
-    
-    for package in packages:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-    
-    print("✓ All packages installed")
+# tiktoken encodings to pre-download and ship next to the executable
+TIKTOKEN_ENCODINGS = ["o200k_base"]
+TIKTOKEN_CACHE_DIR = Path("build") / "tiktoken_cache"
 
-def build_exe():
-    """Build the executable using PyInstaller."""
-    print("\nBuilding executable...")
-    
-    # PyInstaller command with tiktoken data collection
-    cmd = [
-        "pyinstaller",
-        "--onefile",  # Single executable file
-        "--windowed",  # No console window
-        "--name=GitingestDigester",  # Name of the executable
-        "--icon=NONE",  # You can add an icon file here if you have one
-        "--hidden-import=gitingest",
-        "--hidden-import=tiktoken",
-        "--hidden-import=tiktoken_ext",
-        "--hidden-import=tiktoken_ext.openai_public",
-        "--hidden-import=pathspec",
-        "--hidden-import=loguru",
-        "--collect-data=tiktoken_ext",
-        "--collect-all=gitingest",
-        "--collect-all=tiktoken",
-        "--exclude-module=pytest",
-        "--exclude-module=unittest",
-        "gitingest_gui.py"
-    ]
-    
-    try:
-        subprocess.check_call(cmd)
-        print("\n" + "="*60)
-        print("✓ Build successful!")
-        print("="*60)
-        print("\nYour executable is located at:")
-        print("  dist/GitingestDigester.exe")
-        print("\nYou can now:")
-        print("  1. Copy this .exe file anywhere you want")
-        print("  2. Double-click it to run")
-        print("  3. Create a desktop shortcut")
-    except subprocess.CalledProcessError as e:
-        print(f"\n❌ Build failed: {e}")
-        sys.exit(1)
+# Where the pinned dependencies from requirements.lock are installed
+VENDOR_DIR = Path("build") / "vendor"
+
+# PyInstaller used for the build; --optimize needs 6.6 or later
+PYINSTALLER_REQUIREMENT = "pyinstaller==6.22.3"
 
-def create_readme():
-    """Create a README file for the executable."""
-    readme_content = """
+# Python version requirements.lock was compiled for. It is installed with
+# --no-deps, so other versions could silently miss version-specific deps.
+LOCK_PYTHON_VERSION = (3, 11)
+
+# Binaries that are never UPX-compressed (glob patterns, matched against file names)
+UPX_EXCLUDE = [
+    "python3*.dll",
+    "vcruntime*.dll",
+    # Extension modules loaded on every launch; keep them mmap-able
+    "_tkinter.pyd",
+    "_ctypes.pyd",
+    "unicodedata.pyd",
+]
+
+# First HOW TO USE step in README_CONTENT, per bundle mode
+README_RUN_STEP = {
+    "onedir": """1. Double-click GitingestDigester.exe inside the GitingestDigester folder
+   (dist/GitingestDigester/GitingestDigester.exe). Keep the whole folder
+   together - the .exe needs the files next to it.""",
+    "onefile": "1. Double-click GitingestDigester.exe",
+}
+
+README_CONTENT = """
 Gitingest Folder Digester
 =========================
 
@@ -71,7 +51,7 @@ perfect for feeding into AI language models.
 
 HOW TO USE:
 -----------
-1. Double-click GitingestDigester.exe
+{run_step}
 2. Click "Browse..." to select a folder
 3. Choose where to save the output (optional)
 4. Click "Create Digest"
@@ -98,11 +78,156 @@ https://github.com/coderamp-labs/gitingest
 
 Version: 1.0
 """
+
+def install_requirements():
+    """Install PyInstaller and the pinned app dependencies from requirements.lock."""
+    print("Installing required packages...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", PYINSTALLER_REQUIREMENT])
+    
+    # App dependencies go into VENDOR_DIR exactly as pinned, without re-resolving
+    subprocess.check_call([
+        sys.executable, "-m", "pip", "install",
+        "--no-deps",
+        "--require-hashes",
+        "--upgrade",
+        "-r", "requirements.lock",
+        "--target", str(VENDOR_DIR)
+    ])
+    
+    print("✓ All packages installed")
+
+def cache_tiktoken_encodings():
+    """Download the tiktoken encoding files into TIKTOKEN_CACHE_DIR.
+
+    The files are shipped as plain data and found at runtime through the
+    TIKTOKEN_CACHE_DIR environment variable, so they are only read when
+    token counting actually runs.
+    """
+    print("\nCaching tiktoken encodings...")
+    TIKTOKEN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    env = dict(
+        os.environ,
+        TIKTOKEN_CACHE_DIR=str(TIKTOKEN_CACHE_DIR.resolve()),
+        PYTHONPATH=str(VENDOR_DIR.resolve())
+    )
+    
+    for encoding in TIKTOKEN_ENCODINGS:
+        subprocess.check_call(
+            [sys.executable, "-c", f"import tiktoken; tiktoken.get_encoding({encoding!r})"],
+            env=env
+        )
+    
+    print("✓ tiktoken encodings cached")
+
+def build_exe(pack="onedir"):
+    """Build the executable using PyInstaller.
+
+    ``pack`` is either "onedir" (default, no per-launch unpacking) or
+    "onefile" (single .exe that extracts itself to a temp dir on every run).
+    """
+    print("\nBuilding executable...")
+    
+    # PyInstaller command with tiktoken data collection, run with this
+    # interpreter so the bundled Python is the one main() version-checked
+    cmd = [
+        sys.executable, "-m", "PyInstaller",
+        f"--{pack}",  # onedir starts much faster than onefile
+        "--windowed",  # No console window
+        "--optimize=2",  # Strip asserts and docstrings from bundled bytecode
+        "--name=GitingestDigester",  # Name of the executable
+        "--icon=NONE",  # You can add an icon file here if you have one
+        "--splash", "splash.png",  # Shown by the bootloader while Python starts up
+        "--paths", str(VENDOR_DIR),  # Pinned dependencies from requirements.lock
+        "--hidden-import=gitingest",
+        "--hidden-import=tiktoken",
+        "--hidden-import=tiktoken_ext",
+        "--hidden-import=tiktoken_ext.openai_public",
+        "--hidden-import=pathspec",
+        "--hidden-import=loguru",
+        "--collect-data=tiktoken_ext",
+        "--collect-all=gitingest",
+        "--collect-submodules=tiktoken",
+        f"--add-data={TIKTOKEN_CACHE_DIR}{os.pathsep}tiktoken_cache",  # Encodings, loaded on demand
+        # Keep large unused packages out of the bundle
+        "--exclude-module=numpy",
+        "--exclude-module=scipy",
+        "--exclude-module=matplotlib",
+        "--exclude-module=PyQt5",
+        "--exclude-module=PyQt6",
+        "--exclude-module=pandas",
+        "--exclude-module=IPython",
+        "--exclude-module=cryptography",
+        "--exclude-module=pytest",
+        "--exclude-module=test",
+        "--exclude-module=unittest",
+    ]
+    
+    # Keep .pyc files loose on disk instead of in a compressed PYZ. onedir only:
+    # a onefile build would extract every one of them to %TEMP% on each launch.
+    if pack == "onedir":
+        cmd.append("--debug=noarchive")
+    
+    # Strip symbols from bundled binaries. Not on Windows: PyInstaller advises
+    # against it there, and Git/MSYS2/MinGW put a strip on PATH that would
+    # happily mangle python3x.dll and the .pyd files.
+    if sys.platform != "win32" and shutil.which("strip"):
+        cmd.append("--strip")
+    
+    # Set UPX_DIR (e.g. C:\tools\upx) to compress binaries with UPX
+    if os.environ.get("UPX_DIR"):
+        cmd += ["--upx-dir", os.environ["UPX_DIR"]]
+    cmd += [f"--upx-exclude={name}" for name in UPX_EXCLUDE]
+    
+    cmd.append("gitingest_gui.py")
+    
+    # --paths only reaches Analysis; the --collect-* hooks run earlier in the
+    # generated spec and need the vendored packages importable via PYTHONPATH
+    env = dict(os.environ, PYTHONPATH=str(VENDOR_DIR.resolve()))
     
-    Path("README.txt").write_text(readme_content)
+    try:
+        subprocess.check_call(cmd, env=env)
+        print("\n" + "="*60)
+        print("✓ Build successful!")
+        print("="*60)
+        if pack == "onedir":
+            print("\nYour application folder is located at:")
+            print("  dist/GitingestDigester/")
+            print("\nYou can now:")
+            print("  1. Zip or copy the whole GitingestDigester folder anywhere you want")
+            print("  2. Double-click GitingestDigester.exe inside it to run")
+            print("  3. Create a desktop shortcut to GitingestDigester.exe")
+        else:
+            print("\nYour executable is located at:")
+            print("  dist/GitingestDigester.exe")
+            print("\nYou can now:")
+            print("  1. Copy this .exe file anywhere you want")
+            print("  2. Double-click it to run")
+            print("  3. Create a desktop shortcut")
+    except subprocess.CalledProcessError as e:
+        print(f"\n❌ Build failed: {e}")
+        sys.exit(1)
+
+def create_readme(pack="onedir"):
+    """Create a README file for the executable built with ``pack``."""
+    readme_content = README_CONTENT.format(run_step=README_RUN_STEP[pack])
+    # Explicit UTF-8 so the build machine's locale encoding doesn't matter, and
+    # CRLF so older Windows Notepad shows the lines
+    Path("README.txt").write_text(readme_content, encoding="utf-8", newline="\r\n")
     print("✓ README.txt created")
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build the Gitingest Windows executable.")
+    parser.add_argument(
+        "--pack",
+        choices=["onedir", "onefile"],
+        default="onedir",
+        help="PyInstaller bundle mode (default: onedir, which starts faster)"
+    )
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+    
     print("="*60)
     print("Gitingest Windows Executable Builder")
     print("="*60)
@@ -113,15 +238,29 @@ def main():
         print("Please save the GUI script as 'gitingest_gui.py' first.")
         sys.exit(1)
     
+    if not Path("requirements.lock").exists():
+        print("\n❌ Error: requirements.lock not found!")
+        print("Run this script from the folder that contains requirements.lock.")
+        sys.exit(1)
+    
+    if sys.version_info[:2] != LOCK_PYTHON_VERSION:
+        required = ".".join(map(str, LOCK_PYTHON_VERSION))
+        print(f"\n❌ Error: requirements.lock is pinned for Python {required}!")
+        print(f"Please run this script with Python {required}, or regenerate the lock file.")
+        sys.exit(1)
+    
     try:
         # Create README
-        create_readme()
+        create_readme(args.pack)
         
         # Install requirements
         install_requirements()
         
+        # Pre-download tiktoken encodings
+        cache_tiktoken_encodings()
+        
         # Build executable
-        build_exe()
+        build_exe(args.pack)
         
     except KeyboardInterrupt:
         print("\n\nBuild cancelled by user.")
@@ -22,46 +22,97 @@ except:
     except:
         pass
 
-from io import StringIO
-
-# Redirect stdout and stderr to prevent logging errors in windowed mode
-sys.stdout = StringIO()
-sys.stderr = StringIO()
+# Redirect stdout and stderr to prevent logging errors in windowed mode.
+# Nothing reads this output, so send it to the null device rather than
+# buffering it in memory.
+_null = open(os.devnull, 'w', buffering=1, encoding='utf-8')
+sys.stdout = _null
+sys.stderr = _null
 
 os.environ['LOG_LEVEL'] = 'CRITICAL'
 os.environ['PYTHONDONTWRITEBYTECODE'] = '1'
 
-# Monkey-patch locale.getpreferredencoding to always return UTF-8
+# Point tiktoken at the encoding files shipped with the frozen app
+if getattr(sys, 'frozen', False):
+    os.environ['TIKTOKEN_CACHE_DIR'] = os.path.join(
+        getattr(sys, '_MEIPASS', os.path.dirname(sys.executable)),
+        'tiktoken_cache'
+    )
+
+# Monkey-patch locale.getpreferredencoding to always return UTF-8, so any
+# library that asks locale for the default encoding gets UTF-8, not cp1252
 original_getpreferredencoding = locale.getpreferredencoding
-def patched_getpreferredencoding(do_setlocale=True):
-    return 'utf-8'
-locale.getpreferredencoding = patched_getpreferredencoding
+_UTF8 = sys.intern('utf-8')
+locale.getpreferredencoding = lambda do_setlocale=True, _u=_UTF8: _u
 
 # Now import everything else
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
-import threading
+import concurrent.futures
+import functools
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=1)
+def _get_ingest():
+    """Import gitingest on first use, patch it for UTF-8 and return ``ingest``.
+
+    gitingest (and tiktoken behind it) is slow to import, so this is kept
+    off the startup path and only paid once, on the first digest.
+    """
+    # Patch gitingest's encoding detection before importing
+    import gitingest.utils.file_utils as file_utils
+    import gitingest.schemas.filesystem as filesystem
+    
+    # Override _get_preferred_encodings to only try UTF-8 (with and without BOM).
+    # gitingest already reports files whose first chunk isn't UTF-8 as binary,
+    # so the latin/cp1252 fallbacks are never needed. filesystem imports the
+    # function by name, so that's the reference that has to be replaced.
+    def utf8_first_encodings():
+        return ('utf-8', 'utf-8-sig')
+    file_utils._get_preferred_encodings = utf8_first_encodings
+    filesystem._get_preferred_encodings = utf8_first_encodings
+    
+    from gitingest import ingest
+    return ingest
+
+
 def run_ingest(folder_path, output_file, status_text, progress_bar, window):
-    """Run the ingestion with UTF-8 enforcement."""
+    """Run the ingestion with UTF-8 enforcement.
+
+    Called on the worker thread; every widget update is posted to the Tk
+    thread with after_idle() instead of being made here.
+    """
+    def _append(text):
+        status_text.insert(tk.END, text)
+        status_text.see(tk.END)
+    
+    def post(func, *args):
+        """Run func on the Tk thread; ignored once the window is closed."""
+        try:
+            window.after_idle(func, *args)
+        except (RuntimeError, tk.TclError):
+            pass
+    
+    def write(text):
+        """Append text to the status area on the Tk thread."""
+        post(_append, text)
+    
+    def set_progress(value):
+        """Move the progress bar on the Tk thread."""
+        post(progress_bar.configure, {'value': value})
+    
     try:
-        # Patch gitingest's encoding detection before importing
-        import gitingest.utils.file_utils as file_utils
-        
-        # Override _get_preferred_encodings to return UTF-8 first
-        original_get_encodings = file_utils._get_preferred_encodings
-        def utf8_first_encodings():
-            return ['utf-8', 'utf-8-sig', 'latin-1']
-        file_utils._get_preferred_encodings = utf8_first_encodings
-        
-        from gitingest import ingest
+        write("Loading gitingest...\n")
+        ingest = _get_ingest()
         
-        status_text.insert(tk.END, f"Processing: {folder_path}\n")
-        status_text.insert(tk.END, f"Output: {output_file}\n\n")
-        status_text.see(tk.END)
-        window.update()
+        # ingest() is the one long phase and reports no progress of its own,
+        # so the bar sits at 50% until it returns - say so in the status
+        write(
+            f"Processing: {folder_path}\nOutput: {output_file}\n\n"
+            "Scanning folder and writing digest - this can take a while for large folders...\n\n"
+        )
+        set_progress(50)
         
         # Run ingestion
         summary, tree, content = ingest(
@@ -70,26 +121,26 @@ def run_ingest(folder_path, output_file, status_text, progress_bar, window):
         )
         
         # Update status
-        status_text.insert(tk.END, "="*60 + "\n")
-        status_text.insert(tk.END, "SUMMARY\n")
-        status_text.insert(tk.END, "="*60 + "\n")
-        status_text.insert(tk.END, summary + "\n\n")
-        status_text.insert(tk.END, "✓ Digest completed successfully!\n")
-        status_text.insert(tk.END, f"✓ Saved to: {output_file}\n")
-        status_text.see(tk.END)
+        write("".join([
+            "="*60, "\nSUMMARY\n",
+            "="*60, "\n",
+            summary, "\n\n",
+            "✓ Digest completed successfully!\n",
+            f"✓ Saved to: {output_file}\n"
+        ]))
+        set_progress(100)
         
-        progress_bar.stop()
-        progress_bar['mode'] = 'determinate'
-        progress_bar['value'] = 100
-        
-        messagebox.showinfo("Success", f"Digest created successfully!\n\nSaved to:\n{output_file}")
+        post(
+            messagebox.showinfo,
+            "Success",
+            f"Digest created successfully!\n\nSaved to:\n{output_file}"
+        )
         
     except Exception as e:
-        progress_bar.stop()
+        set_progress(0)
         error_msg = str(e)
-        status_text.insert(tk.END, f"\n❌ Error: {error_msg}\n")
-        status_text.see(tk.END)
-        messagebox.showerror("Error", f"Failed to create digest:\n\n{error_msg}")
+        write(f"\n❌ Error: {error_msg}\n")
+        post(messagebox.showerror, "Error", f"Failed to create digest:\n\n{error_msg}")
 
 
 class DigestApp:
@@ -103,114 +154,166 @@ class DigestApp:
         self.folder_path = tk.StringVar()
         self.output_path = tk.StringVar(value="digest.txt")
         
+        # Single reusable worker thread for ingestion
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="ingest"
+        )
+        self._future = None
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
         self.create_widgets()
     
     def create_widgets(self):
+        # Styles - configured once and shared by all widgets below
+        style = ttk.Style(self.root)
+        style.theme_use("clam")  # Native themes ignore button colors
+        style.configure("Title.TFrame", background="#2c3e50")
+        style.configure(
+            "Title.TLabel",
+            background="#2c3e50",
+            foreground="white",
+            font=("Arial", 16, "bold")
+        )
+        style.configure(
+            "Subtitle.TLabel",
+            background="#2c3e50",
+            foreground="#ecf0f1",
+            font=("Arial", 9)
+        )
+        style.configure("Browse.TButton", background="#3498db", foreground="white", padding=(15, 2))
+        style.map("Browse.TButton", background=[("active", "#2980b9")])
+        style.configure(
+            "Process.TButton",
+            background="#27ae60",
+            foreground="white",
+            font=("Arial", 12, "bold"),
+            padding=(20, 10)
+        )
+        style.map("Process.TButton", background=[("disabled", "#95a5a6"), ("active", "#229954")])
+        
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(1, weight=1)
+        
         # Title
-        title_frame = tk.Frame(self.root, bg="#2c3e50", pady=15)
-        title_frame.pack(fill=tk.X)
+        title_frame = ttk.Frame(self.root, style="Title.TFrame", padding=(0, 15))
+        title_frame.grid(row=0, column=0, sticky="ew")
+        title_frame.columnconfigure(0, weight=1)
         
-        title_label = tk.Label(
+        title_label = ttk.Label(
             title_frame,
             text="📁 Gitingest Folder Digester",
-            font=("Arial", 16, "bold"),
-            bg="#2c3e50",
-            fg="white"
+            style="Title.TLabel"
         )
-        title_label.pack()
+        title_label.grid(row=0, column=0)
         
-        subtitle_label = tk.Label(
+        subtitle_label = ttk.Label(
             title_frame,
             text="Convert any folder into a prompt-friendly text digest",
-            font=("Arial", 9),
-            bg="#2c3e50",
-            fg="#ecf0f1"
+            style="Subtitle.TLabel"
         )
-        subtitle_label.pack()
+        subtitle_label.grid(row=1, column=0)
         
         # Main content frame
-        content_frame = tk.Frame(self.root, padx=20, pady=20)
-        content_frame.pack(fill=tk.BOTH, expand=True)
+        content_frame = ttk.Frame(self.root, padding=20)
+        content_frame.grid(row=1, column=0, sticky="nsew")
+        content_frame.columnconfigure(0, weight=1)
+        content_frame.rowconfigure(4, weight=1)
         
         # Folder selection
-        folder_frame = tk.LabelFrame(content_frame, text="Select Folder to Digest", padx=10, pady=10)
-        folder_frame.pack(fill=tk.X, pady=(0, 10))
+        folder_frame = ttk.LabelFrame(content_frame, text="Select Folder to Digest", padding=10)
+        folder_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
+        folder_frame.columnconfigure(0, weight=1)
         
-        folder_entry = tk.Entry(folder_frame, textvariable=self.folder_path, width=50)
-        folder_entry.pack(side=tk.LEFT, padx=(0, 5), fill=tk.X, expand=True)
+        folder_entry = ttk.Entry(folder_frame, textvariable=self.folder_path, width=50)
+        folder_entry.grid(row=0, column=0, sticky="ew", padx=(0, 5))
         
-        browse_btn = tk.Button(
+        browse_btn = ttk.Button(
             folder_frame,
             text="Browse...",
             command=self.browse_folder,
-            bg="#3498db",
-            fg="white",
-            padx=15
+            style="Browse.TButton"
         )
-        browse_btn.pack(side=tk.LEFT)
+        browse_btn.grid(row=0, column=1)
         
         # Output file selection
-        output_frame = tk.LabelFrame(content_frame, text="Output File", padx=10, pady=10)
-        output_frame.pack(fill=tk.X, pady=(0, 10))
+        output_frame = ttk.LabelFrame(content_frame, text="Output File", padding=10)
+        output_frame.grid(row=1, column=0, sticky="ew", pady=(0, 10))
+        output_frame.columnconfigure(0, weight=1)
         
-        output_entry = tk.Entry(output_frame, textvariable=self.output_path, width=50)
-        output_entry.pack(side=tk.LEFT, padx=(0, 5), fill=tk.X, expand=True)
+        output_entry = ttk.Entry(output_frame, textvariable=self.output_path, width=50)
+        output_entry.grid(row=0, column=0, sticky="ew", padx=(0, 5))
         
-        save_btn = tk.Button(
+        save_btn = ttk.Button(
             output_frame,
             text="Save As...",
             command=self.browse_output,
-            bg="#3498db",
-            fg="white",
-            padx=15
+            style="Browse.TButton"
         )
-        save_btn.pack(side=tk.LEFT)
+        save_btn.grid(row=0, column=1)
         
         # Process button
-        self.process_btn = tk.Button(
+        self.process_btn = ttk.Button(
             content_frame,
             text="🚀 Create Digest",
             command=self.process_folder,
-            bg="#27ae60",
-            fg="white",
-            font=("Arial", 12, "bold"),
-            padx=20,
-            pady=10
+            style="Process.TButton"
         )
-        self.process_btn.pack(pady=10)
+        self.process_btn.grid(row=2, column=0, pady=10)
         
         # Progress bar
         self.progress = ttk.Progressbar(
             content_frame,
-            mode='indeterminate',
+            mode='determinate',
             length=300
         )
-        self.progress.pack(pady=(0, 10))
+        self.progress.grid(row=3, column=0, pady=(0, 10))
         
-        # Status text area
-        status_frame = tk.LabelFrame(content_frame, text="Status", padx=10, pady=10)
-        status_frame.pack(fill=tk.BOTH, expand=True)
+        # Status text area - a plain label until there is something to log;
+        # the ScrolledText is built by _ensure_status() on first use
+        self.status_frame = ttk.LabelFrame(content_frame, text="Status", padding=10)
+        self.status_frame.grid(row=4, column=0, sticky="nsew")
+        self.status_frame.columnconfigure(0, weight=1)
+        self.status_frame.rowconfigure(0, weight=1)
         
-        self.status_text = scrolledtext.ScrolledText(
-            status_frame,
-            height=10,
-            wrap=tk.WORD,
-            font=("Consolas", 9)
+        self.status_label = ttk.Label(
+            self.status_frame,
+            text="Ready to process a folder.\n\n"
+                 "Instructions:\n"
+                 "1. Click 'Browse...' to select a folder\n"
+                 "2. Choose output file location (optional)\n"
+                 "3. Click 'Create Digest' to start\n",
+            font=("Consolas", 9),
+            anchor="nw",
+            justify=tk.LEFT
         )
-        self.status_text.pack(fill=tk.BOTH, expand=True)
-        self.status_text.insert(tk.END, "Ready to process a folder.\n\n")
-        self.status_text.insert(tk.END, "Instructions:\n")
-        self.status_text.insert(tk.END, "1. Click 'Browse...' to select a folder\n")
-        self.status_text.insert(tk.END, "2. Choose output file location (optional)\n")
-        self.status_text.insert(tk.END, "3. Click 'Create Digest' to start\n")
+        self.status_label.grid(row=0, column=0, sticky="nsew")
+        self.status_text = None
+    
+    def _ensure_status(self):
+        """Replace the placeholder label with the ScrolledText on first use."""
+        if self.status_text is None:
+            self.status_label.grid_forget()
+            self.status_text = scrolledtext.ScrolledText(
+                self.status_frame,
+                height=10,
+                wrap=tk.WORD,
+                font=("Consolas", 9)
+            )
+            self.status_text.grid(row=0, column=0, sticky="nsew")
+        return self.status_text
     
     def browse_folder(self):
         folder = filedialog.askdirectory(title="Select Folder to Digest")
         if folder:
             self.folder_path.set(folder)
-            folder_name = Path(folder).name
-            default_output = str(Path(folder).parent / f"{folder_name}_digest.txt")
-            self.output_path.set(default_output)
+            self.root.after_idle(self._compute_default_output, folder)
+    
+    def _compute_default_output(self, folder):
+        """Suggest <folder>_digest.txt next to the selected folder."""
+        folder_name = Path(folder).name
+        default_output = str(Path(folder).parent / f"{folder_name}_digest.txt")
+        self.output_path.set(default_output)
     
     def browse_output(self):
         file = filedialog.asksaveasfilename(
@@ -237,29 +340,52 @@ class DigestApp:
             messagebox.showwarning("No Output", "Please specify an output file.")
             return
         
-        self.status_text.delete(1.0, tk.END)
-        self.progress['mode'] = 'indeterminate'
+        self._ensure_status().delete(1.0, tk.END)
         self.progress['value'] = 0
-        self.progress.start(10)
         self.process_btn.config(state=tk.DISABLED)
         
-        thread = threading.Thread(
-            target=lambda: self._process_wrapper(folder, output)
-        )
-        thread.daemon = True
-        thread.start()
+        self._future = self._pool.submit(self._process_wrapper, folder, output)
+        self._future.add_done_callback(self._on_future_done)
     
     def _process_wrapper(self, folder, output):
-        """Wrapper to re-enable button after processing."""
+        """Run the ingestion on the worker thread."""
+        run_ingest(folder, output, self.status_text, self.progress, self.root)
+    
+    def _on_future_done(self, future):
+        """Hop back to the Tk thread once the worker finishes."""
         try:
-            run_ingest(folder, output, self.status_text, self.progress, self.root)
-        finally:
-            self.process_btn.config(state=tk.NORMAL)
+            self.root.after(0, self._on_process_done)
+        except (RuntimeError, tk.TclError):
+            pass  # Window already closed
+    
+    def _on_process_done(self):
+        """Re-enable the button on the Tk thread after processing."""
+        self.process_btn.config(state=tk.NORMAL)
+    
+    def on_close(self):
+        """Drop any queued work and close the window.
+
+        A running ingest can't be cancelled, and the pool's worker thread is
+        joined at interpreter exit, so exit immediately instead of leaving a
+        windowless process running until gitingest finishes.
+        """
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+        if self._future is not None and not self._future.done():
+            os._exit(0)
 
 
 def main():
     root = tk.Tk()
     app = DigestApp(root)
+    
+    # Close the PyInstaller splash screen now that the window is built
+    try:
+        import pyi_splash
+        pyi_splash.close()
+    except ImportError:
+        pass
+    
     root.mainloop()
 
 